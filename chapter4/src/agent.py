@@ -1,12 +1,22 @@
-import operator
+import asyncio
+import random
+import time
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Annotated, Literal, Sequence, TypedDict
 
+import httpx
+import orjson
+import tiktoken
 from langchain_core.utils.function_calling import convert_to_openai_tool
 from langgraph.constants import Send
 from langgraph.graph import END, START, StateGraph
 from langgraph.pregel import Pregel
-from openai import OpenAI
-from openai.types.chat import ChatCompletionMessageParam
+from openai import APIConnectionError, APIStatusError, AsyncOpenAI, RateLimitError
+from openai.types.chat import ChatCompletionMessageParam, ChatCompletionMessageToolCall
+from pydantic import BaseModel, TypeAdapter
 
 from src.configs import Settings
 from src.custom_logger import setup_logger
@@ -24,10 +34,177 @@ from src.prompts import HelpDeskAgentPrompts
 # Each cycle consists of: tool selection -> tool execution -> subtask answer -> reflection.
 MAX_CHALLENGE_COUNT = 3
 
+# Maximum number of LLM requests allowed in flight at the same time.
+# Subtasks run concurrently after planning, so this bounds the fan-out to stay
+# under the OpenAI requests/tokens-per-minute limits.
+MAX_CONCURRENT_LLM_CALLS = 8
+
+# Stable identifier sent with every request so OpenAI routes them to the same
+# prompt-cache shard, improving automatic prefix-cache hit rates.
+PROMPT_CACHE_KEY = "xyz-helpdesk-agent"
+
+# How often to poll a Batch API job for completion. Batch jobs trade latency
+# (up to 24h) for a 50% discount on input tokens, so polling can be leisurely.
+BATCH_POLL_INTERVAL_SECONDS = 30
+
+# Retry/backoff policy for transient OpenAI failures (429s, 5xx, connection
+# errors). Delays grow exponentially from the base and are jittered to avoid a
+# thundering herd when many concurrent subtasks hit a rate limit together.
+MAX_LLM_ATTEMPTS = 5
+LLM_RETRY_BASE_DELAY_SECONDS = 1.0
+
+# Sustained request/token budgets enforced client-side over a sliding one-minute
+# window. Tune these to the rate limits of your OpenAI tier.
+MAX_REQUESTS_PER_MINUTE = 450
+MAX_TOKENS_PER_MINUTE = 180_000
+
+
+class _RateLimitBucket:
+    """
+    Sliding one-minute window over requests and estimated tokens.
+
+    All LLM calls acquire from a shared bucket before sending, so the agent
+    sustains the highest throughput its rate limits allow instead of bursting
+    into 429s and stalling in backoff.
+    """
+
+    def __init__(self, max_requests_per_minute: int, max_tokens_per_minute: int) -> None:
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+
+        # Each entry is (monotonic timestamp, estimated tokens) for one request.
+        self._events: deque[tuple[float, int]] = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        """Block until the request fits inside the per-minute budgets."""
+        # An estimate larger than the whole per-minute budget could never
+        # satisfy the admission check and would spin here forever. Clamp it
+        # so the request is admitted alone once the window drains; if it
+        # really is oversized the API rejects it with a proper error instead.
+        estimated_tokens = min(estimated_tokens, self.max_tokens_per_minute)
+
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+
+                # Drop events that have aged out of the one-minute window.
+                while self._events and now - self._events[0][0] > 60:
+                    self._events.popleft()
+
+                used_tokens = sum(tokens for _, tokens in self._events)
+                if (
+                    len(self._events) < self.max_requests_per_minute
+                    and used_tokens + estimated_tokens <= self.max_tokens_per_minute
+                ):
+                    self._events.append((now, estimated_tokens))
+                    return
+
+                # Sleep until the oldest event expires, then re-check.
+                wait = 60 - (now - self._events[0][0]) if self._events else 1.0
+            await asyncio.sleep(max(wait, 0.1))
+
+
+# Shared budget across every HelpDeskAgent instance in the process.
+_RATE_LIMIT_BUCKET = _RateLimitBucket(MAX_REQUESTS_PER_MINUTE, MAX_TOKENS_PER_MINUTE)
+
+
+@lru_cache(maxsize=1)
+def _token_encoding() -> tiktoken.Encoding:
+    # o200k_base covers the current gpt-4o family; an exact match is not
+    # required since the estimate only feeds the client-side TPM budget.
+    return tiktoken.get_encoding("o200k_base")
+
+
+def _estimate_request_tokens(messages: list[dict]) -> int:
+    """Rough token estimate for a chat request, used for rate-limit budgeting."""
+    encoding = _token_encoding()
+    return sum(
+        len(encoding.encode(str(message.get("content") or ""))) + 4
+        for message in messages
+    )
+
+
+def _structured_response_format(model: type[BaseModel]) -> dict:
+    """
+    Build a Structured Outputs `response_format` dict for a raw request body.
+
+    The Batch API takes plain JSON bodies, so the Pydantic models used with
+    `beta.chat.completions.parse` in the online path have to be expressed as an
+    explicit json_schema here.
+    """
+    schema = model.model_json_schema()
+    schema["additionalProperties"] = False
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": model.__name__, "strict": True, "schema": schema},
+    }
+
+
+# Precompiled Pydantic serializers for the hot message-history paths.
+# TypeAdapter builds the core-schema serializer once at import; the per-call
+# model_dump()/model_dump_json() methods re-resolve schema state every call.
+_TOOL_CALL_DUMP = TypeAdapter(ChatCompletionMessageToolCall).dump_python
+_REFLECTION_DUMP = TypeAdapter(ReflectionResult).dump_json
+
 # Initialize a module-level logger to record agent execution details.
 logger = setup_logger(__file__)
 
 
+class _SubtaskContext:
+    """
+    Read-only (question, plan) pair shared by every Send dispatch of one run.
+
+    Send payloads used to re-materialize the full question and plan for each
+    subtask; for a long plan that copies the same multi-KB payload into the
+    Pregel queue N times. Each Send now carries only the id of a context
+    registered in _SUBTASK_CONTEXTS, and the subtask runner resolves it. The
+    registry holds weak references, so a context disappears together with the
+    run that created it.
+    """
+
+    __slots__ = ("question", "plan", "__weakref__")
+
+    def __init__(self, question: str, plan: list[str]) -> None:
+        self.question = question
+        self.plan = plan
+
+
+_SUBTASK_CONTEXTS: "weakref.WeakValueDictionary[int, _SubtaskContext]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _append(left, right):
+    """
+    LangGraph reducer that extends the accumulated list in place.
+
+    The default `operator.add` reducer allocates a fresh sequence on every
+    merge, which is O(n^2) across a Send fan-out of n subtasks and re-copies
+    the accumulated Pydantic models each time. Extending the existing list
+    keeps the whole merge O(n).
+    """
+    if left is None:
+        return list(right)
+    if not isinstance(left, list):
+        left = list(left)
+    left.extend(right)
+    return left
+
+
+class AssistantToolCallMsg(TypedDict):
+    """
+    Assistant message carrying the tool_calls chosen by select_tools.
+
+    Typing this message statically lets mypy/IDEs catch schema drift between
+    select_tools (which produces it) and execute_tools (which consumes it),
+    instead of relying on defensive runtime checks in the hot path.
+    """
+
+    role: Literal["assistant"]
+    tool_calls: list[dict]
+
+
 class AgentState(TypedDict):
     """
     Main (top-level) state for the agent graph.
@@ -43,7 +220,7 @@ class AgentState(TypedDict):
     question: str
     plan: list[str]
     current_step: int
-    subtask_results: Annotated[Sequence[Subtask], operator.add]
+    subtask_results: Annotated[list[Subtask], _append]
     last_answer: str
 
 
@@ -69,8 +246,8 @@ class AgentSubGraphState(TypedDict):
     is_completed: bool
     messages: list[ChatCompletionMessageParam]
     challenge_count: int
-    tool_results: Annotated[Sequence[Sequence[SearchOutput]], operator.add]
-    reflection_results: Annotated[Sequence[ReflectionResult], operator.add]
+    tool_results: Annotated[list[Sequence[SearchOutput]], _append]
+    reflection_results: Annotated[list[ReflectionResult], _append]
     subtask_answer: str
 
 
@@ -90,6 +267,9 @@ class HelpDeskAgent:
     Notes:
         - Tools are LangChain tools passed into the agent at initialization.
         - Reflection is used as a quality gate; if reflection returns NG, the agent retries.
+        - All LLM-calling nodes are async: subtasks are independent after planning,
+          so LangGraph's async executor fans them out concurrently instead of
+          blocking on one network round-trip at a time.
     """
 
     def __init__(
@@ -107,13 +287,139 @@ class HelpDeskAgent:
         # Build a fast lookup map from tool name -> tool object for execution.
         self.tool_map = {tool.name: tool for tool in tools}
 
+        # Convert the LangChain tools to the OpenAI tool schema once. The
+        # conversion walks Pydantic schemas and produces identical output every
+        # call, so memoizing it avoids per-subtask overhead and keeps the
+        # serialized tool JSON byte-identical, which OpenAI's automatic prompt
+        # caching requires for a prefix hit.
+        self._openai_tools = [convert_to_openai_tool(tool) for tool in tools]
+
         # Store prompt templates used by the planner/subtask/final answer stages.
         self.prompts = prompts
 
-        # Initialize an OpenAI client for all LLM calls in this agent.
-        self.client = OpenAI(api_key=self.settings.openai_api_key)
+        # Initialize exactly one async OpenAI client for all LLM calls in this
+        # agent. The client wraps a single httpx connection pool, so the dozens
+        # of concurrent subtask requests reuse warm TCP/TLS connections instead
+        # of paying a handshake per call. HTTP/2 additionally multiplexes many
+        # in-flight requests over one connection.
+        self.aclient = AsyncOpenAI(
+            api_key=self.settings.openai_api_key,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                timeout=60,
+                http2=True,
+            ),
+        )
+
+        # Bound the number of simultaneous LLM requests so the concurrent
+        # subtask fan-out stays within OpenAI rate limits.
+        self._llm_semaphore = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
+
+        # Shared bounded thread pool for tools that only expose a blocking
+        # invoke. Sized to the expected tool concurrency so sync tool I/O runs
+        # off the event loop without spawning unbounded threads.
+        self._tool_pool = ThreadPoolExecutor(
+            max_workers=min(32, 4 * len(tools) or 8), thread_name_prefix="tool"
+        )
+
+        # Strong reference to the current run's shared subtask context; the
+        # registry in _SUBTASK_CONTEXTS only holds it weakly.
+        self._active_subtask_ctx: _SubtaskContext | None = None
+
+    async def aclose(self) -> None:
+        """
+        Release the shared OpenAI client and its httpx connection pool.
+
+        Call this once the agent is no longer needed (run_agent does so
+        automatically) so keep-alive connections are drained cleanly and the
+        tool worker threads are released.
+        """
+        await self.aclient.close()
+        self._tool_pool.shutdown(wait=True)
+
+    async def _call_with_retry(self, create_fn, /, **kwargs):
+        """
+        Call an OpenAI endpoint with adaptive rate limiting and retries.
+
+        Before each attempt the shared rate-limit bucket is charged with a
+        token estimate for the request, so concurrent subtasks pace themselves
+        under the account's RPM/TPM budget instead of provoking 429s. Transient
+        failures (rate limits, connection errors, 5xx) are retried with
+        jittered exponential backoff; other client errors raise immediately.
+
+        Args:
+            create_fn: The bound OpenAI coroutine function to call
+                (e.g. self.aclient.chat.completions.create).
+            **kwargs: Arguments forwarded to the endpoint.
+
+        Returns:
+            The endpoint's response object.
+        """
+
+        estimated_tokens = _estimate_request_tokens(kwargs.get("messages", []))
+
+        for attempt in range(MAX_LLM_ATTEMPTS):
+            await _RATE_LIMIT_BUCKET.acquire(estimated_tokens)
+            try:
+                async with self._llm_semaphore:
+                    return await create_fn(**kwargs)
+            except (RateLimitError, APIConnectionError, APIStatusError) as e:
+                # 4xx errors other than 429 are not transient; retrying cannot help.
+                if (
+                    isinstance(e, APIStatusError)
+                    and not isinstance(e, RateLimitError)
+                    and e.status_code < 500
+                ):
+                    raise
+                if attempt == MAX_LLM_ATTEMPTS - 1:
+                    raise
+
+                delay = min(60, LLM_RETRY_BASE_DELAY_SECONDS * 2**attempt) * (
+                    0.5 + random.random()
+                )
+                logger.warning(
+                    "OpenAI request failed (%s); retrying in %.1fs", e, delay
+                )
+                await asyncio.sleep(delay)
+
+    def _build_plan_messages(self, question: str) -> list[dict]:
+        """
+        Build the planner message list for a given question.
+
+        Shared between the online path (create_plan) and the Batch API path
+        (run_agent_batch) so both send byte-identical prompts.
+        """
+        return [
+            {"role": "system", "content": self.prompts.planner_system_prompt},
+            {
+                "role": "user",
+                "content": self.prompts.planner_user_prompt_render(question=question),
+            },
+        ]
+
+    def _build_answer_messages(
+        self, question: str, plan: list[str], subtask_results: list[tuple[str, str]]
+    ) -> list[dict]:
+        """
+        Build the final-answer message list from the question, plan, and the
+        (subtask name, subtask answer) pairs.
 
-    def create_plan(self, state: AgentState) -> dict:
+        Shared between the online path (create_answer) and the Batch API path
+        (run_agent_batch). Static instructions stay in the cacheable prefix and
+        the interpolated values go in the dynamic tail.
+        """
+        dynamic_prompt = self.prompts.create_last_answer_user_prompt_dynamic_render(
+            question=question,
+            plan=plan,
+            subtask_results=str(subtask_results),
+        )
+        return [
+            {"role": "system", "content": self.prompts.create_last_answer_system_prompt},
+            {"role": "user", "content": self.prompts.create_last_answer_user_prompt_static},
+            {"role": "user", "content": dynamic_prompt},
+        ]
+
+    async def create_plan(self, state: AgentState) -> dict:
         """
         Generate a subtask plan for answering the user's question.
 
@@ -130,34 +436,25 @@ class HelpDeskAgent:
 
         logger.info("🚀 Starting plan generation process...")
 
-        # Build the system prompt for planning.
-        system_prompt = self.prompts.planner_system_prompt
-
-        # Format the user prompt by injecting the user's question.
-        user_prompt = self.prompts.planner_user_prompt.format(
-            question=state["question"],
-        )
-
         # Construct the message list for the OpenAI request.
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ]
-        logger.debug(f"Final prompt messages: {messages}")
+        messages = self._build_plan_messages(state["question"])
+        logger.debug("Final prompt messages: %s", messages)
 
         # Call OpenAI with Structured Outputs parsing into the Plan model.
         try:
             logger.info("Sending request to OpenAI...")
-            response = self.client.beta.chat.completions.parse(
+            response = await self._call_with_retry(
+                self.aclient.beta.chat.completions.parse,
                 model=self.settings.openai_model,
                 messages=messages,
                 response_format=Plan,
                 temperature=0,
                 seed=0,
+                user=PROMPT_CACHE_KEY,
             )
             logger.info("✅ Successfully received response from OpenAI.")
         except Exception as e:
-            logger.error(f"Error during OpenAI request: {e}")
+            logger.error("Error during OpenAI request: %s", e)
             raise
 
         # Extract the parsed structured output (Plan) from the response.
@@ -168,15 +465,16 @@ class HelpDeskAgent:
         # Return the plan subtasks to update the state in the main graph.
         return {"plan": plan.subtasks}
 
-    def select_tools(self, state: AgentSubGraphState) -> dict:
+    async def select_tools(self, state: AgentSubGraphState) -> dict:
         """
         Select which tools should be executed to solve the current subtask.
 
         Behavior:
-            - Converts the available LangChain tools into OpenAI tool schema.
+            - Uses the OpenAI tool schema precomputed from the LangChain tools.
             - If this is the first attempt (challenge_count == 0), creates a fresh prompt.
-            - If this is a retry, reuses previous messages, trims tool output messages
-              (to reduce tokens), and appends a retry instruction.
+            - If this is a retry, rebuilds a compact prompt: the original task, a
+              summary of prior reflection advice, and a retry instruction. Bulky
+              tool payloads from earlier attempts are not re-sent.
 
         Args:
             state: The current subgraph state including question/plan/subtask and history.
@@ -188,15 +486,17 @@ class HelpDeskAgent:
 
         logger.info("🚀 Starting tool selection process...")
 
-        # Convert LangChain tool definitions to OpenAI-compatible tool definitions.
-        logger.debug("Converting tools for OpenAI format...")
-        openai_tools = [convert_to_openai_tool(tool) for tool in self.tools]
+        # Reuse the OpenAI-compatible tool definitions converted once in __init__.
+        openai_tools = self._openai_tools
 
         # If this is the first attempt, use the standard tool-selection prompt.
+        # The static instructions come first and the interpolated values last so
+        # every request shares the longest possible byte-identical prefix for
+        # OpenAI's automatic prompt caching.
         if state["challenge_count"] == 0:
             logger.debug("Creating user prompt for tool selection...")
 
-            user_prompt = self.prompts.subtask_tool_selection_user_prompt.format(
+            dynamic_prompt = self.prompts.subtask_tool_selection_user_prompt_dynamic_render(
                 question=state["question"],
                 plan=state["plan"],
                 subtask=state["subtask"],
@@ -204,42 +504,58 @@ class HelpDeskAgent:
 
             messages = [
                 {"role": "system", "content": self.prompts.subtask_system_prompt},
-                {"role": "user", "content": user_prompt},
+                {"role": "user", "content": self.prompts.subtask_tool_selection_user_prompt_static},
+                {"role": "user", "content": dynamic_prompt},
             ]
 
-        # If this is a retry, reuse message history and append a retry instruction.
+        # If this is a retry, rebuild a compact prompt from scratch instead of
+        # re-sending the accumulated history. Earlier attempts carry bulky tool
+        # payloads and tool_calls blobs whose size grows with every attempt;
+        # all the model needs to try again is the original task plus the advice
+        # produced by the reflections so far.
         else:
             logger.debug("Creating user prompt for tool retry...")
 
-            # Reuse previous conversation context.
-            messages: list = state["messages"]
+            dynamic_prompt = self.prompts.subtask_tool_selection_user_prompt_dynamic_render(
+                question=state["question"],
+                plan=state["plan"],
+                subtask=state["subtask"],
+            )
+
+            # Summarize all prior reflections into one assistant message so the
+            # retry prompt grows O(attempts) bytes instead of
+            # O(attempts x tool output size).
+            reflection_summary = "\n".join(
+                f"Attempt {attempt}: {reflection.advice}"
+                for attempt, reflection in enumerate(state["reflection_results"], start=1)
+            )
 
-            # Token optimization:
-            # Remove tool-output messages (and any tool_call artifacts) so we keep
-            # reasoning context but drop bulky retrieval payloads.
             messages = [
-                message
-                for message in messages
-                if message["role"] != "tool" or "tool_calls" not in message
+                {"role": "system", "content": self.prompts.subtask_system_prompt},
+                {"role": "user", "content": self.prompts.subtask_tool_selection_user_prompt_static},
+                {"role": "user", "content": dynamic_prompt},
+                {
+                    "role": "assistant",
+                    "content": f"Advice from reflections on previous attempts:\n{reflection_summary}",
+                },
+                {"role": "user", "content": self.prompts.subtask_retry_answer_user_prompt},
             ]
 
-            # Add a retry instruction based on the reflection feedback loop design.
-            user_retry_prompt = self.prompts.subtask_retry_answer_user_prompt
-            messages.append({"role": "user", "content": user_retry_prompt})
-
         # Ask the model to decide which tool(s) to call for this subtask.
         try:
             logger.info("Sending request to OpenAI...")
-            response = self.client.chat.completions.create(
+            response = await self._call_with_retry(
+                self.aclient.chat.completions.create,
                 model=self.settings.openai_model,
                 messages=messages,
                 tools=openai_tools,  # type: ignore
                 temperature=0,
                 seed=0,
+                user=PROMPT_CACHE_KEY,
             )
             logger.info("✅ Successfully received response from OpenAI.")
         except Exception as e:
-            logger.error(f"Error during OpenAI request: {e}")
+            logger.error("Error during OpenAI request: %s", e)
             raise
 
         # Validate tool calls exist; this workflow requires the model to choose tools.
@@ -247,10 +563,10 @@ class HelpDeskAgent:
             raise ValueError("Tool calls are None")
 
         # Store the tool calls in a message format compatible with downstream execution.
-        ai_message = {
+        ai_message: AssistantToolCallMsg = {
             "role": "assistant",
             "tool_calls": [
-                tool_call.model_dump()
+                _TOOL_CALL_DUMP(tool_call)
                 for tool_call in response.choices[0].message.tool_calls
             ],
         }
@@ -261,23 +577,21 @@ class HelpDeskAgent:
         # Return the updated message history (subgraph state will be updated with this).
         return {"messages": messages}
 
-    def execute_tools(self, state: AgentSubGraphState) -> dict:
+    async def execute_tools(self, state: AgentSubGraphState) -> dict:
         """
         Execute the tool calls generated in the tool-selection step.
 
         This function:
             - Reads tool calls from the last assistant message.
             - Looks up the matching tool in self.tool_map.
-            - Executes each tool with the provided arguments.
-            - Appends tool responses back into the messages list in "tool" role format.
+            - Executes all tool calls concurrently with asyncio.gather.
+            - Appends tool responses back into the messages list in "tool" role format,
+              preserving the original call order.
             - Returns structured ToolResult objects for traceability.
 
         Args:
             state: The current subgraph state containing tool_calls in messages.
 
-        Raises:
-            ValueError: If tool_calls are missing (None).
-
         Returns:
             A dict containing updated "messages" and a list of ToolResult objects
             under "tool_results".
@@ -286,32 +600,65 @@ class HelpDeskAgent:
         logger.info("🚀 Starting tool execution process...")
         messages = state["messages"]
 
-        # Extract tool calls from the last assistant message.
+        # Extract tool calls from the last assistant message. select_tools
+        # already raised if the model returned none, so a missing value here
+        # is a broken invariant, not a runtime condition to handle; the assert
+        # documents it and is stripped under `python -O`.
         tool_calls = messages[-1]["tool_calls"]
+        assert tool_calls, "select_tools invariant broken: no tool_calls in last message"
+
+        # Hoist attribute and dict lookups out of the per-call loops; subtasks
+        # regularly carry several parallel tool calls, so the repeated
+        # resolution of self.tool_map and bound methods adds up.
+        tool_map = self.tool_map
+
+        # Parse each tool call's JSON arguments exactly once (orjson decodes at
+        # C speed); the parsed dict is passed to the tool and stored on the
+        # ToolResult so nothing downstream has to re-parse the raw string.
+        parsed_args = [
+            orjson.loads(tool_call["function"]["arguments"]) for tool_call in tool_calls
+        ]
 
-        # Ensure tool calls exist; otherwise execution cannot proceed.
-        if tool_calls is None:
-            logger.error("Tool calls are None")
-            logger.error(f"Messages: {messages}")
-            raise ValueError("Tool calls are None")
+        async def _run_tool(tool_call: dict, tool_args: dict) -> list[SearchOutput]:
+            # Find the tool implementation by name and execute it.
+            tool = tool_map[tool_call["function"]["name"]]
+
+            # Prefer the tool's native async path. Every Runnable inherits
+            # ainvoke, so check for an actual coroutine implementation: for a
+            # sync-only tool the inherited ainvoke would just punt to
+            # LangChain's internal executor. Instead run its blocking invoke
+            # on the agent's bounded tool pool so the event loop stays
+            # responsive while sync tool I/O is in flight.
+            if getattr(tool, "coroutine", None) is not None:
+                return await tool.ainvoke(tool_args)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._tool_pool, tool.invoke, tool_args)
+
+        # Models routinely emit several independent tool calls per turn
+        # (e.g. keyword search + QA search), so run them all concurrently:
+        # the subtask waits for the slowest tool instead of the sum of all.
+        results = await asyncio.gather(
+            *(
+                _run_tool(tool_call, tool_args)
+                for tool_call, tool_args in zip(tool_calls, parsed_args, strict=True)
+            )
+        )
 
         tool_results = []
+        tool_results_append = tool_results.append
+        messages_append = messages.append
 
-        # Execute each tool call and append results to message history.
-        for tool_call in tool_calls:
-            tool_name = tool_call["function"]["name"]
-            tool_args = tool_call["function"]["arguments"]
-
-            # Find the tool implementation by name.
-            tool = self.tool_map[tool_name]
-
-            # Execute tool and get the list of SearchOutput results.
-            tool_result: list[SearchOutput] = tool.invoke(tool_args)
+        # Zip results back in the original call order so the tool_call_id
+        # pairing in the message history stays deterministic.
+        for tool_call, tool_args, tool_result in zip(
+            tool_calls, parsed_args, results, strict=True
+        ):
+            fn = tool_call["function"]
 
             # Store a structured record of the tool execution.
-            tool_results.append(
+            tool_results_append(
                 ToolResult(
-                    tool_name=tool_name,
+                    tool_name=fn["name"],
                     args=tool_args,
                     results=tool_result,
                 )
@@ -319,10 +666,13 @@ class HelpDeskAgent:
 
             # Append tool output to the conversation in OpenAI tool-message format.
             # The tool_call_id links this output back to the specific tool request.
-            messages.append(
+            # orjson serializes the structured results far faster than str().
+            messages_append(
                 {
                     "role": "tool",
-                    "content": str(tool_result),
+                    "content": orjson.dumps(
+                        [result.model_dump() for result in tool_result]
+                    ).decode(),
                     "tool_call_id": tool_call["id"],
                 }
             )
@@ -332,7 +682,7 @@ class HelpDeskAgent:
         # Wrap tool_results in a list-of-lists to support multi-attempt aggregation.
         return {"messages": messages, "tool_results": [tool_results]}
 
-    def create_subtask_answer(self, state: AgentSubGraphState) -> dict:
+    async def create_subtask_answer(self, state: AgentSubGraphState) -> dict:
         """
         Draft a natural-language answer for the current subtask.
 
@@ -352,15 +702,17 @@ class HelpDeskAgent:
         # Request the model to generate a subtask-level answer based on tool outputs.
         try:
             logger.info("Sending request to OpenAI...")
-            response = self.client.chat.completions.create(
+            response = await self._call_with_retry(
+                self.aclient.chat.completions.create,
                 model=self.settings.openai_model,
                 messages=messages,
                 temperature=0,
                 seed=0,
+                user=PROMPT_CACHE_KEY,
             )
             logger.info("✅ Successfully received response from OpenAI.")
         except Exception as e:
-            logger.error(f"Error during OpenAI request: {e}")
+            logger.error("Error during OpenAI request: %s", e)
             raise
 
         # Extract the generated subtask answer text.
@@ -373,16 +725,18 @@ class HelpDeskAgent:
 
         return {"messages": messages, "subtask_answer": subtask_answer}
 
-    def reflect_subtask(self, state: AgentSubGraphState) -> dict:
+    async def reflect_subtask(self, state: AgentSubGraphState) -> dict:
         """
         Reflect on (evaluate) the quality and completeness of the subtask answer.
 
         The reflection step:
-            - Adds a reflection prompt to the messages.
-            - Calls the model using Structured Outputs into ReflectionResult.
+            - On the terminal attempt, skips the LLM call entirely (the verdict
+              cannot trigger another retry), records a synthesized result, and
+              sets the fallback subtask answer.
+            - Otherwise adds a reflection prompt to the messages and calls the
+              model using Structured Outputs into ReflectionResult.
             - Updates state with reflection results and increments challenge_count.
             - Marks is_completed based on reflection_result.is_completed.
-            - If max retries are exceeded and still incomplete, sets a fallback answer.
 
         Args:
             state: The current subgraph state including the latest subtask answer.
@@ -402,6 +756,30 @@ class HelpDeskAgent:
         logger.info("🚀 Starting reflection process...")
         messages = state["messages"]
 
+        # On the terminal attempt the reflection verdict cannot change control
+        # flow: _should_continue_exec_subtask_flow ends the loop once
+        # challenge_count reaches MAX_CHALLENGE_COUNT regardless of the result.
+        # Skip the structured-parse LLM round-trip and synthesize the record.
+        # The drafted subtask answer was never validated by a reflection pass,
+        # so replace it with the explicit fallback — the final composer must
+        # not present an unreviewed draft as a real answer.
+        if state["challenge_count"] + 1 >= MAX_CHALLENGE_COUNT:
+            logger.info("Max attempts reached; skipping reflection LLM call.")
+            reflection_result = ReflectionResult(
+                advice="Maximum number of attempts reached; no further retries are possible.",
+                is_completed=False,
+            )
+            messages.append(
+                {"role": "assistant", "content": _REFLECTION_DUMP(reflection_result).decode()}
+            )
+            return {
+                "messages": messages,
+                "reflection_results": [reflection_result],
+                "challenge_count": state["challenge_count"] + 1,
+                "is_completed": False,
+                "subtask_answer": f"Could not find an answer for: {state['subtask']}.",
+            }
+
         # Add reflection instruction to trigger evaluation.
         user_prompt = self.prompts.subtask_reflection_user_prompt
         messages.append({"role": "user", "content": user_prompt})
@@ -409,16 +787,18 @@ class HelpDeskAgent:
         # Call OpenAI and parse reflection output into ReflectionResult.
         try:
             logger.info("Sending request to OpenAI...")
-            response = self.client.beta.chat.completions.parse(
+            response = await self._call_with_retry(
+                self.aclient.beta.chat.completions.parse,
                 model=self.settings.openai_model,
                 messages=messages,
                 response_format=ReflectionResult,
                 temperature=0,
                 seed=0,
+                user=PROMPT_CACHE_KEY,
             )
             logger.info("✅ Successfully received response from OpenAI.")
         except Exception as e:
-            logger.error(f"Error during OpenAI request: {e}")
+            logger.error("Error during OpenAI request: %s", e)
             raise
 
         reflection_result = response.choices[0].message.parsed
@@ -426,9 +806,12 @@ class HelpDeskAgent:
             raise ValueError("Reflection result is None")
 
         # Append the reflection result to message history for traceability/audit.
-        messages.append({"role": "assistant", "content": reflection_result.model_dump_json()})
+        messages.append(
+            {"role": "assistant", "content": _REFLECTION_DUMP(reflection_result).decode()}
+        )
 
-        # Prepare the subgraph state update.
+        # Prepare the subgraph state update. The terminal-attempt case returned
+        # early above, so this update never exceeds MAX_CHALLENGE_COUNT.
         update_state = {
             "messages": messages,
             "reflection_results": [reflection_result],
@@ -436,101 +819,131 @@ class HelpDeskAgent:
             "is_completed": reflection_result.is_completed,
         }
 
-        # If maximum retries are reached and the subtask is still incomplete,
-        # provide a fallback message indicating the answer could not be found.
-        if (
-            update_state["challenge_count"] >= MAX_CHALLENGE_COUNT
-            and not reflection_result.is_completed
-        ):
-            update_state["subtask_answer"] = f"Could not find an answer for: {state['subtask']}."
-
         logger.info("Reflection complete!")
         return update_state
 
-    def create_answer(self, state: AgentState) -> dict:
+    async def _stream_answer(self, state: AgentState):
         """
-        Compose the final answer to the user using all subtask answers.
+        Stream the final answer for the given state, yielding content deltas.
 
-        This function:
-            - Extracts (subtask_name, subtask_answer) pairs from the subtask results.
-            - Calls the LLM with a "final answer" system prompt and a user prompt containing
-              the original question, plan, and summarized subtask outputs.
-            - Returns the final response text as "last_answer".
+        Streaming does not change total generation time, but the first tokens
+        arrive as soon as the model produces them: the time-to-first-token is
+        logged here, and run_agent_stream surfaces the tokens to the caller
+        immediately instead of waiting for the full completion.
 
         Args:
             state: The top-level agent state containing all completed subtask results.
 
-        Returns:
-            A dict containing {"last_answer": "..."} to update the main graph state.
+        Yields:
+            str: The next chunk of the final answer text.
         """
 
         logger.info("🚀 Starting final answer creation process...")
 
-        # System prompt instructing how to compose a user-facing help-desk answer.
-        system_prompt = self.prompts.create_last_answer_system_prompt
-
         # Extract only the subtask name and its final answer (omit tool payloads).
         subtask_results = [
             (result.task_name, result.subtask_answer)
             for result in state["subtask_results"]
         ]
 
-        # Inject question, plan, and subtask results into the final-answer user prompt.
-        user_prompt = self.prompts.create_last_answer_user_prompt.format(
-            question=state["question"],
-            plan=state["plan"],
-            subtask_results=str(subtask_results),
+        messages = self._build_answer_messages(
+            state["question"], state["plan"], subtask_results
         )
 
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ]
-
-        # Request the final composed response from the model.
+        # Request the final composed response from the model as a stream.
         try:
             logger.info("Sending request to OpenAI...")
-            response = self.client.chat.completions.create(
+            request_started = time.monotonic()
+            stream = await self._call_with_retry(
+                self.aclient.chat.completions.create,
                 model=self.settings.openai_model,
                 messages=messages,
                 temperature=0,
                 seed=0,
+                user=PROMPT_CACHE_KEY,
+                stream=True,
             )
-            logger.info("✅ Successfully received response from OpenAI.")
+
+            first_chunk_seen = False
+            async for chunk in stream:
+                if not first_chunk_seen:
+                    logger.info(
+                        "✅ First answer token after %.2fs (TTFT)",
+                        time.monotonic() - request_started,
+                    )
+                    first_chunk_seen = True
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
         except Exception as e:
-            logger.error(f"Error during OpenAI request: {e}")
+            logger.error("Error during OpenAI request: %s", e)
             raise
 
         logger.info("Final answer creation complete!")
 
-        return {"last_answer": response.choices[0].message.content}
+    async def create_answer(self, state: AgentState) -> dict:
+        """
+        Compose the final answer to the user using all subtask answers.
+
+        This function:
+            - Extracts (subtask_name, subtask_answer) pairs from the subtask results.
+            - Streams the LLM completion (so TTFT is reported) and joins the
+              chunks into the final response text.
+            - Returns the final response text as "last_answer".
 
-    def _execute_subgraph(self, state: AgentState):
+        Args:
+            state: The top-level agent state containing all completed subtask results.
+
+        Returns:
+            A dict containing {"last_answer": "..."} to update the main graph state.
+        """
+
+        buffer = []
+        async for token in self._stream_answer(state):
+            buffer.append(token)
+
+        return {"last_answer": "".join(buffer)}
+
+    async def _execute_subgraph(self, state: dict):
         """
         Execute the subgraph for one subtask and return a Subtask object.
 
         This method:
+            - Resolves the shared (question, plan) context referenced by the
+              Send payload's ctx_id, or reads them directly from the state for
+              callers that pass them inline (run_agent_batch).
             - Builds the subgraph workflow.
             - Invokes it with the current subtask.
             - Converts the subgraph outputs into a Subtask model.
             - Returns a dict that can be merged into the main agent state.
 
+        Because this node is async, LangGraph executes all Send(...) dispatches
+        concurrently on the event loop: each subtask overlaps its LLM round-trips
+        with the others instead of waiting in line.
+
         Args:
-            state: The current top-level agent state.
+            state: The Send payload ({"ctx_id", "current_step"}) or an inline
+                state dict with question/plan/current_step.
 
         Returns:
             dict: {"subtask_results": [Subtask(...)]}
         """
 
+        # Resolve the shared read-only context registered by the fan-out step.
+        if "ctx_id" in state:
+            ctx = _SUBTASK_CONTEXTS[state["ctx_id"]]
+            question, plan = ctx.question, ctx.plan
+        else:
+            question, plan = state["question"], state["plan"]
+
         # Create a fresh subgraph instance (planner/execute/reflect loop).
         subgraph = self._create_subgraph()
 
         # Invoke the subgraph for the current subtask.
-        result = subgraph.invoke(
+        result = await subgraph.ainvoke(
             {
-                "question": state["question"],
-                "plan": state["plan"],
-                "subtask": state["plan"][state["current_step"]],
+                "question": question,
+                "plan": plan,
+                "subtask": plan[state["current_step"]],
                 "current_step": state["current_step"],
                 "is_completed": False,
                 "challenge_count": 0,
@@ -558,18 +971,30 @@ class HelpDeskAgent:
         list of Send messages that instruct the graph to run 'execute_subtasks'
         once for each subtask index.
 
+        The question and plan are read-only inside the subgraph, so they are
+        frozen once into a shared _SubtaskContext and each Send carries only
+        its id plus the subtask index, rather than re-materializing the full
+        payload per subtask.
+
         Args:
             state: The main agent state containing the plan.
 
         Returns:
             list: A list of Send(...) objects, one per subtask.
         """
+
+        ctx = _SubtaskContext(state["question"], state["plan"])
+        _SUBTASK_CONTEXTS[id(ctx)] = ctx
+
+        # Keep the context alive for the duration of the run; the registry
+        # entry is weak and would vanish without a strong reference.
+        self._active_subtask_ctx = ctx
+
         return [
             Send(
                 "execute_subtasks",
                 {
-                    "question": state["question"],
-                    "plan": state["plan"],
+                    "ctx_id": id(ctx),
                     "current_step": idx,
                 },
             )
@@ -674,15 +1099,18 @@ class HelpDeskAgent:
         # Compile into a runnable graph.
         return workflow.compile()
 
-    def run_agent(self, question: str) -> AgentResult:
+    async def run_agent(self, question: str) -> AgentResult:
         """
         Run the full agent workflow end-to-end for a given user question.
 
         This method:
             - Creates the compiled main graph.
-            - Invokes it with the user's question and initial step index.
+            - Invokes it asynchronously so subtasks fan out concurrently.
             - Wraps the output into a structured AgentResult object.
 
+        From synchronous code, call `asyncio.run(agent.run_agent(question))`;
+        in a notebook, simply `await agent.run_agent(question)`.
+
         Args:
             question: The user's input question.
 
@@ -693,8 +1121,12 @@ class HelpDeskAgent:
         # Build the full agent graph (plan -> subtasks -> final answer).
         app = self.create_graph()
 
-        # Invoke the graph with initial state.
-        result = app.invoke({"question": question, "current_step": 0})
+        # Invoke the graph with initial state, then drain the connection pool
+        # once the run finishes so no keep-alive sockets linger.
+        try:
+            result = await app.ainvoke({"question": question, "current_step": 0})
+        finally:
+            await self.aclose()
 
         # Convert raw outputs into the typed AgentResult model.
         return AgentResult(
@@ -703,3 +1135,207 @@ class HelpDeskAgent:
             subtasks=result["subtask_results"],
             answer=result["last_answer"],
         )
+
+    async def run_agent_stream(self, question: str):
+        """
+        Run the agent workflow and stream the final answer tokens to the caller.
+
+        Planning and subtask execution behave exactly as in run_agent; only the
+        final composition step streams. The total wall time is unchanged, but
+        the user starts reading the answer at the model's first token instead
+        of after the full completion.
+
+        Args:
+            question: The user's input question.
+
+        Yields:
+            str: The next chunk of the final answer text.
+        """
+
+        # Build a reduced graph that stops after subtask execution; the final
+        # answer is streamed outside the graph so tokens reach the caller.
+        workflow = StateGraph(AgentState)
+        workflow.add_node("create_plan", self.create_plan)
+        workflow.add_node("execute_subtasks", self._execute_subgraph)
+        workflow.add_edge(START, "create_plan")
+        workflow.add_conditional_edges(
+            "create_plan",
+            self._should_continue_exec_subtasks,
+        )
+        workflow.add_edge("execute_subtasks", END)
+        app = workflow.compile()
+
+        try:
+            result = await app.ainvoke({"question": question, "current_step": 0})
+
+            async for token in self._stream_answer(
+                {
+                    "question": question,
+                    "plan": result["plan"],
+                    "current_step": 0,
+                    "subtask_results": result["subtask_results"],
+                    "last_answer": "",
+                }
+            ):
+                yield token
+        finally:
+            await self.aclose()
+
+    async def _run_chat_batch(self, bodies: dict[str, dict]) -> dict[str, dict]:
+        """
+        Submit one OpenAI Batch API job and wait for its results.
+
+        Args:
+            bodies: Mapping of custom_id -> /v1/chat/completions request body.
+
+        Raises:
+            RuntimeError: If the batch job does not complete successfully.
+
+        Returns:
+            Mapping of custom_id -> response "message" dict for each request.
+        """
+
+        # Serialize the requests in the Batch API JSONL format.
+        lines = [
+            orjson.dumps(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body,
+                }
+            )
+            for custom_id, body in bodies.items()
+        ]
+
+        # Upload the JSONL payload and start the batch job.
+        batch_file = await self.aclient.files.create(
+            file=b"\n".join(lines), purpose="batch"
+        )
+        batch = await self.aclient.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        logger.info("Submitted batch %s with %d requests", batch.id, len(bodies))
+
+        # Poll until the job leaves its in-flight states.
+        while batch.status in ("validating", "in_progress", "finalizing"):
+            await asyncio.sleep(BATCH_POLL_INTERVAL_SECONDS)
+            batch = await self.aclient.batches.retrieve(batch.id)
+
+        if batch.status != "completed" or batch.output_file_id is None:
+            raise RuntimeError(f"Batch {batch.id} finished with status: {batch.status}")
+
+        # Download the output file and index responses by custom_id.
+        output = await self.aclient.files.content(batch.output_file_id)
+        results = {}
+        for line in output.text.splitlines():
+            if not line:
+                continue
+            record = orjson.loads(line)
+            results[record["custom_id"]] = record["response"]["body"]["choices"][0]["message"]
+        return results
+
+    async def run_agent_batch(self, questions: list[str]) -> list[AgentResult]:
+        """
+        Run the agent over many questions using the OpenAI Batch API.
+
+        The Batch API halves input-token cost for workloads that can tolerate
+        up to 24 hours of turnaround, so this path is intended for offline/bulk
+        evaluation rather than interactive use. Because each stage depends on
+        the previous one's output, the pipeline runs in phases:
+
+            1) One batch job containing every planning request.
+            2) Subtask execution stays online: each retry attempt depends on
+               the previous attempt's tool output, so it cannot be flattened
+               into a batch — but all subtasks of all questions still run
+               concurrently on the event loop.
+            3) One batch job containing every final-answer request.
+
+        Single-question calls fall back to the fully online run_agent, where
+        batching would only add latency.
+
+        Args:
+            questions: The list of user questions to answer.
+
+        Returns:
+            One AgentResult per question, in input order.
+        """
+
+        # Interactive single-question calls gain nothing from batching.
+        if len(questions) == 1:
+            return [await self.run_agent(questions[0])]
+
+        try:
+            # Phase 1: plan every question in one discounted batch job.
+            plan_bodies = {
+                f"plan:{idx}": {
+                    "model": self.settings.openai_model,
+                    "messages": self._build_plan_messages(question),
+                    "response_format": _structured_response_format(Plan),
+                    "temperature": 0,
+                    "seed": 0,
+                }
+                for idx, question in enumerate(questions)
+            }
+            plan_messages = await self._run_chat_batch(plan_bodies)
+            plans = [
+                Plan.model_validate_json(plan_messages[f"plan:{idx}"]["content"])
+                for idx in range(len(questions))
+            ]
+
+            # Phase 2: execute all subtasks of all questions concurrently online.
+            async def _run_subtasks(question: str, plan: Plan) -> list[Subtask]:
+                updates = await asyncio.gather(
+                    *(
+                        self._execute_subgraph(
+                            {
+                                "question": question,
+                                "plan": plan.subtasks,
+                                "current_step": idx,
+                            }
+                        )
+                        for idx in range(len(plan.subtasks))
+                    )
+                )
+                return [update["subtask_results"][0] for update in updates]
+
+            subtasks_per_question = await asyncio.gather(
+                *(
+                    _run_subtasks(question, plan)
+                    for question, plan in zip(questions, plans, strict=True)
+                )
+            )
+
+            # Phase 3: compose every final answer in a second batch job.
+            answer_bodies = {
+                f"answer:{idx}": {
+                    "model": self.settings.openai_model,
+                    "messages": self._build_answer_messages(
+                        question,
+                        plans[idx].subtasks,
+                        [
+                            (subtask.task_name, subtask.subtask_answer)
+                            for subtask in subtasks_per_question[idx]
+                        ],
+                    ),
+                    "temperature": 0,
+                    "seed": 0,
+                }
+                for idx, question in enumerate(questions)
+            }
+            answer_messages = await self._run_chat_batch(answer_bodies)
+        finally:
+            await self.aclose()
+
+        # Assemble the typed results in input order.
+        return [
+            AgentResult(
+                question=question,
+                plan=plans[idx],
+                subtasks=subtasks_per_question[idx],
+                answer=answer_messages[f"answer:{idx}"]["content"],
+            )
+            for idx, question in enumerate(questions)
+        ]
@@ -1,5 +1,12 @@
+import atexit
 import logging
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
+# Marker attribute set on the root logger once configuration has run, so that
+# repeated setup_logger calls (one per importing module) become cheap no-ops.
+_CONFIGURED_FLAG = "_genai_configured"
 
 
 def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
@@ -7,14 +14,20 @@ def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     Create and configure a named logger that outputs logs to the console (stdout).
 
     This helper centralizes logging configuration so all modules in the project can
-    use a consistent log format and log level. It uses `logging.basicConfig()` to
-    configure the root logger with a StreamHandler pointing to standard output.
+    use a consistent log format and log level. The first call installs a
+    QueueHandler on the root logger; every later call just returns a named logger.
 
     Key behaviors:
     - Logs are printed to stdout (useful for Docker/Kubernetes logs and CI).
-    - The log format includes timestamp, level, and message.
-    - `force=True` resets existing handlers to prevent duplicate logs when this
-      function is called multiple times (common in notebooks/tests).
+    - The log format includes a millisecond timestamp, level, and message.
+    - Configuration is idempotent: a marker on the root logger ensures handlers
+      are installed exactly once, so repeated calls (common in notebooks/tests,
+      and one per importing module here) never duplicate log lines and never
+      tear down handlers that other libraries attached to root.
+    - Records pass through a queue to a background QueueListener thread, which
+      performs the actual formatting and stdout I/O. Emitting a record is then
+      just a non-blocking enqueue, so logging from worker threads or from async
+      graph nodes never stalls the asyncio event loop.
 
     Args:
         name (str):
@@ -30,18 +43,30 @@ def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
             A configured logger instance with the specified name and level.
     """
 
-    # Configure the root logger:
-    # - level=level: show messages at `level` and above (e.g., INFO+).
-    # - format=...: include timestamp, severity, and the log message.
-    # - handlers=[StreamHandler(sys.stdout)]: send logs to stdout explicitly.
-    # - force=True: remove any existing handlers and reconfigure from scratch.
-    #   This prevents duplicated log lines if basicConfig was already called elsewhere.
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s %(levelname)s %(message)s",
-        handlers=[logging.StreamHandler(sys.stdout)],
-        force=True,
-    )
+    root = logging.getLogger()
+
+    if not getattr(root, _CONFIGURED_FLAG, False):
+        # Actual formatting and I/O happen on the listener thread; callers
+        # only pay for putting the record on the queue.
+        log_queue: SimpleQueue = SimpleQueue()
+
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(
+            logging.Formatter(
+                fmt="%(asctime)s.%(msecs)03d %(levelname)s %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S",
+            )
+        )
+
+        listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        listener.start()
+
+        # Flush any queued records when the process exits.
+        atexit.register(listener.stop)
+
+        root.setLevel(level)
+        root.addHandler(QueueHandler(log_queue))
+        setattr(root, _CONFIGURED_FLAG, True)
 
     # Create (or retrieve) a named logger. Using named loggers makes it easier
     # to trace which module produced the log.
@@ -0,0 +1,195 @@
+import os
+from functools import lru_cache
+from typing import Protocol
+
+from openai import OpenAI
+
+from src.configs import Settings
+
+# Name of the environment variable that selects the embedding backend.
+# Unset (or "openai") keeps the remote OpenAI embeddings used throughout the
+# book; "onnx" switches to a self-exported ONNX model and "fastembed" to
+# Qdrant's bundled fastembed models — both run locally with zero network
+# latency and zero per-token cost.
+EMBEDDING_BACKEND_ENV = "EMBEDDING_BACKEND"
+
+# Path to the exported ONNX model file and its tokenizer, read only when the
+# local backend is selected.
+ONNX_MODEL_PATH_ENV = "EMBEDDING_ONNX_MODEL_PATH"
+ONNX_TOKENIZER_ENV = "EMBEDDING_ONNX_TOKENIZER"
+DEFAULT_ONNX_TOKENIZER = "intfloat/multilingual-e5-base"
+
+# Model used by the fastembed backend. bge-m3 is multilingual, so it covers
+# the Japanese Q&A data alongside English.
+FASTEMBED_MODEL_ENV = "EMBEDDING_FASTEMBED_MODEL"
+DEFAULT_FASTEMBED_MODEL = "BAAI/bge-m3"
+
+
+class EmbeddingBackend(Protocol):
+    """
+    Minimal interface every embedding backend implements.
+
+    Both the indexing script and the QA search tool only need "texts in,
+    vectors out", so a Protocol keeps them decoupled from whether vectors
+    come from the OpenAI API or a local model.
+    """
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed a batch of texts, returning one vector per input text."""
+        ...
+
+
+class OpenAIEmbedder:
+    """
+    Default backend: OpenAI's text-embedding-3-small via the embeddings API.
+
+    One request embeds the whole batch, so callers should pass as many texts
+    per call as practical rather than looping one text at a time.
+    """
+
+    def __init__(self, client: OpenAI | None = None, model: str = "text-embedding-3-small") -> None:
+        if client is None:
+            settings = Settings()
+            client = OpenAI(api_key=settings.openai_api_key)
+        self.client = client
+        self.model = model
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        response = self.client.embeddings.create(input=texts, model=self.model)
+        # Embeddings come back in input order
+        return [item.embedding for item in response.data]
+
+
+class OnnxEmbedder:
+    """
+    Optional local backend: an ONNX-exported sentence-embedding model run with
+    onnxruntime on CPU.
+
+    A remote embedding call costs hundreds of milliseconds of network latency
+    plus per-token fees; a local int8-quantized model answers in tens of
+    milliseconds with native batch support. The session is configured with
+    full graph optimization and one intra-op thread per core so a single
+    session.run processes the whole padded batch in parallel.
+
+    Note: the indexing script sizes the Qdrant collection by probing the
+    active backend, so the same EMBEDDING_BACKEND must be selected for both
+    ingest and search — vectors from different backends (or models of
+    different output size) are not interchangeable within one collection.
+
+    onnxruntime and transformers are optional dependencies; they are imported
+    lazily so the default OpenAI path never pays for them.
+    """
+
+    def __init__(self, model_path: str, tokenizer_name: str = DEFAULT_ONNX_TOKENIZER) -> None:
+        try:
+            import onnxruntime
+            from transformers import AutoTokenizer
+        except ImportError as exc:
+            raise ImportError(
+                "The ONNX embedding backend requires the 'onnxruntime' and "
+                "'transformers' packages: uv pip install onnxruntime transformers"
+            ) from exc
+
+        sess_options = onnxruntime.SessionOptions()
+        # Fuse/fold the graph once at load time instead of interpreting it
+        sess_options.graph_optimization_level = (
+            onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        )
+        # Parallelize matmuls inside a single run across all cores
+        sess_options.intra_op_num_threads = os.cpu_count()
+
+        self.session = onnxruntime.InferenceSession(
+            model_path, sess_options, providers=["CPUExecutionProvider"]
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(tokenizer_name)
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        import numpy as np
+
+        # Tokenize the whole batch with padding so one session.run covers it
+        encoded = self.tokenizer(
+            texts, padding=True, truncation=True, return_tensors="np"
+        )
+        outputs = self.session.run(
+            None,
+            {
+                "input_ids": encoded["input_ids"],
+                "attention_mask": encoded["attention_mask"],
+            },
+        )
+
+        # Mean-pool token embeddings over real (non-padding) tokens, then
+        # L2-normalize so cosine similarity behaves like the OpenAI vectors
+        token_embeddings = outputs[0]
+        mask = encoded["attention_mask"][..., np.newaxis].astype(token_embeddings.dtype)
+        pooled = (token_embeddings * mask).sum(axis=1) / mask.sum(axis=1)
+        pooled /= np.linalg.norm(pooled, axis=1, keepdims=True)
+        return pooled.tolist()
+
+
+class FastEmbedEmbedder:
+    """
+    Optional local backend: Qdrant's bundled fastembed library.
+
+    fastembed ships pre-quantized ONNX models and handles tokenization,
+    batching, and threaded onnxruntime inference internally, so it skips the
+    OpenAI network hop without the model-export step the OnnxEmbedder needs —
+    just `uv pip install fastembed` and select the backend.
+
+    The same dimensionality note as OnnxEmbedder applies: the indexing
+    script probes the backend for its output size (1024 for bge-m3) when
+    creating the collection, so ingest and search must select the same
+    EMBEDDING_BACKEND.
+    """
+
+    def __init__(self, model_name: str = DEFAULT_FASTEMBED_MODEL) -> None:
+        try:
+            from fastembed import TextEmbedding
+        except ImportError as exc:
+            raise ImportError(
+                "The fastembed embedding backend requires the 'fastembed' "
+                "package: uv pip install fastembed"
+            ) from exc
+
+        self.model = TextEmbedding(model_name=model_name)
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        # fastembed batches and parallelizes inference internally; embed()
+        # yields numpy vectors lazily, one per input text in order
+        return [vector.tolist() for vector in self.model.embed(texts)]
+
+
+@lru_cache(maxsize=1)
+def get_local_embedding_backend() -> EmbeddingBackend | None:
+    """
+    Return the selected local backend ("onnx" or "fastembed"), else None.
+
+    Callers that have their own tuned remote path (e.g. the indexing script's
+    concurrent OpenAI requests) use this to branch: a local backend needs no
+    network concurrency, just batched inference calls.
+    """
+    backend = os.environ.get(EMBEDDING_BACKEND_ENV, "openai").lower()
+
+    if backend == "onnx":
+        model_path = os.environ.get(ONNX_MODEL_PATH_ENV)
+        if not model_path:
+            raise ValueError(
+                f"{EMBEDDING_BACKEND_ENV}=onnx requires {ONNX_MODEL_PATH_ENV} "
+                "to point at an exported ONNX model file"
+            )
+        tokenizer_name = os.environ.get(ONNX_TOKENIZER_ENV, DEFAULT_ONNX_TOKENIZER)
+        return OnnxEmbedder(model_path, tokenizer_name)
+
+    if backend == "fastembed":
+        model_name = os.environ.get(FASTEMBED_MODEL_ENV, DEFAULT_FASTEMBED_MODEL)
+        return FastEmbedEmbedder(model_name)
+
+    return None
+
+
+@lru_cache(maxsize=1)
+def get_embedding_backend() -> EmbeddingBackend:
+    """
+    Return the configured embedding backend, defaulting to OpenAI.
+    """
+    return get_local_embedding_backend() or OpenAIEmbedder()
@@ -84,7 +84,7 @@ class ToolResult(BaseModel):
     """
 
     tool_name: str = Field(..., description="Name of the tool that was executed")
-    args: str = Field(..., description="Arguments passed to the tool")
+    args: dict = Field(..., description="Parsed arguments passed to the tool")
     results: list[SearchOutput] = Field(..., description="Results returned by the tool")
 
 
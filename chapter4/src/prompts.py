@@ -1,3 +1,5 @@
+import string
+
 PLANNER_SYSTEM_PROMPT = """
 # Role
 You are a help desk agent for a system called XYZ.
@@ -52,17 +54,24 @@ Evaluate whether the tool results and your subtask answer correctly satisfy the
 - If OK, the subtask is complete and no retry is needed.
 """
 
-SUBTASK_TOOL_EXECUTION_USER_PROMPT = """
-Original user question: {question}
-Plan for answering: {plan}
-Current subtask: {subtask}
-
+# The tool-selection user prompt is split into a fully static part and a dynamic
+# part so that every request starts with an identical prefix (system prompt +
+# static instructions + tool schemas). OpenAI automatically caches the longest
+# common prefix of repeated requests, so keeping all interpolated values at the
+# tail maximizes the cache-hit length across the many calls an agent makes.
+SUBTASK_TOOL_EXECUTION_USER_PROMPT_STATIC = """
 Start executing this subtask now.
 Please perform:
 1) Tool selection & execution
 2) Subtask answer
 """
 
+SUBTASK_TOOL_EXECUTION_USER_PROMPT_DYNAMIC = """
+Original user question: {question}
+Plan for answering: {plan}
+Current subtask: {subtask}
+"""
+
 SUBTASK_REFLECTION_USER_PROMPT = """
 Please start Step 3 (Reflection) now.
 """
@@ -87,15 +96,43 @@ Follow all instructions below when composing the final response:
 - Avoid telling the user to contact another team or redirecting them elsewhere.
 """
 
-CREATE_LAST_ANSWER_USER_PROMPT = """
+# Split for the same prompt-caching reason as the tool-selection prompt:
+# static instructions first, interpolated values last.
+CREATE_LAST_ANSWER_USER_PROMPT_STATIC = """
+Please write the final answer based on the execution results below.
+"""
+
+CREATE_LAST_ANSWER_USER_PROMPT_DYNAMIC = """
 User question: {question}
 
 Plan and execution results for answering: {subtask_results}
-
-Please write the final answer.
 """
 
 
+def _compile_template(template: str):
+    """
+    Precompile a str.format-style template into a renderer closure.
+
+    str.format re-parses the template text on every invocation. The prompt
+    templates here are long and rendered on hot paths (once or more per
+    subtask attempt), so the template is walked once with string.Formatter
+    and the returned closure simply concatenates the literal pieces with the
+    supplied keyword values.
+    """
+    pieces = list(string.Formatter().parse(template))
+
+    def render(**kwargs) -> str:
+        parts = []
+        for literal, field_name, format_spec, _ in pieces:
+            parts.append(literal)
+            if field_name is not None:
+                value = kwargs[field_name]
+                parts.append(format(value, format_spec) if format_spec else str(value))
+        return "".join(parts)
+
+    return render
+
+
 class HelpDeskAgentPrompts:
     """
     Simple prompt container class for the XYZ help desk agent.
@@ -112,22 +149,38 @@ class HelpDeskAgentPrompts:
         planner_system_prompt: str = PLANNER_SYSTEM_PROMPT,
         planner_user_prompt: str = PLANNER_USER_PROMPT,
         subtask_system_prompt: str = SUBTASK_SYSTEM_PROMPT,
-        subtask_tool_selection_user_prompt: str = SUBTASK_TOOL_EXECUTION_USER_PROMPT,
+        subtask_tool_selection_user_prompt_static: str = SUBTASK_TOOL_EXECUTION_USER_PROMPT_STATIC,
+        subtask_tool_selection_user_prompt_dynamic: str = SUBTASK_TOOL_EXECUTION_USER_PROMPT_DYNAMIC,
         subtask_reflection_user_prompt: str = SUBTASK_REFLECTION_USER_PROMPT,
         subtask_retry_answer_user_prompt: str = SUBTASK_RETRY_ANSWER_USER_PROMPT,
         create_last_answer_system_prompt: str = CREATE_LAST_ANSWER_SYSTEM_PROMPT,
-        create_last_answer_user_prompt: str = CREATE_LAST_ANSWER_USER_PROMPT,
+        create_last_answer_user_prompt_static: str = CREATE_LAST_ANSWER_USER_PROMPT_STATIC,
+        create_last_answer_user_prompt_dynamic: str = CREATE_LAST_ANSWER_USER_PROMPT_DYNAMIC,
     ) -> None:
         # Planner prompts (generate subtasks from the user question)
         self.planner_system_prompt = planner_system_prompt
         self.planner_user_prompt = planner_user_prompt
 
-        # Subtask execution prompts (tool selection/execution, answering, reflection)
+        # Subtask execution prompts (tool selection/execution, answering, reflection).
+        # The tool-selection prompt is split into static/dynamic halves so the
+        # static prefix stays byte-identical across requests for prompt caching.
         self.subtask_system_prompt = subtask_system_prompt
-        self.subtask_tool_selection_user_prompt = subtask_tool_selection_user_prompt
+        self.subtask_tool_selection_user_prompt_static = subtask_tool_selection_user_prompt_static
+        self.subtask_tool_selection_user_prompt_dynamic = subtask_tool_selection_user_prompt_dynamic
         self.subtask_reflection_user_prompt = subtask_reflection_user_prompt
         self.subtask_retry_answer_user_prompt = subtask_retry_answer_user_prompt
 
         # Final answer prompts (synthesize subtask outputs into the final user response)
         self.create_last_answer_system_prompt = create_last_answer_system_prompt
-        self.create_last_answer_user_prompt = create_last_answer_user_prompt
+        self.create_last_answer_user_prompt_static = create_last_answer_user_prompt_static
+        self.create_last_answer_user_prompt_dynamic = create_last_answer_user_prompt_dynamic
+
+        # Precompiled renderers for the templates formatted on hot paths, so
+        # str.format does not re-parse the template text on every LLM call.
+        self.planner_user_prompt_render = _compile_template(planner_user_prompt)
+        self.subtask_tool_selection_user_prompt_dynamic_render = _compile_template(
+            subtask_tool_selection_user_prompt_dynamic
+        )
+        self.create_last_answer_user_prompt_dynamic_render = _compile_template(
+            create_last_answer_user_prompt_dynamic
+        )
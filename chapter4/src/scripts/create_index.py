@@ -1,15 +1,67 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
 import os
-from glob import glob
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Iterable, Iterator
 
+import tiktoken
 from elasticsearch import Elasticsearch, helpers
 from langchain_community.document_loaders import PyPDFLoader
 from langchain_community.document_loaders.csv_loader import CSVLoader
 from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from openai import OpenAI
+from openai import AsyncOpenAI, RateLimitError
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, PointStruct, VectorParams
+from qdrant_client.models import (
+    Batch,
+    Distance,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    VectorParams,
+)
+
+from src.embeddings import get_local_embedding_backend
+
+# Token-aware packing limits for embedding batches. The embeddings endpoint
+# accepts a list input, so one near-full request replaces many round-trips;
+# packing by measured token count (instead of a fixed document count) keeps
+# every request close to the budget regardless of chunk lengths.
+EMBEDDING_BATCH_MAX_TOKENS = 7000
+EMBEDDING_BATCH_MAX_ITEMS = 2048
+
+# Retry policy for transient embedding failures (rate limits).
+EMBEDDING_MAX_RETRIES = 5
+
+# Number of embedding requests kept in flight at once. Each request is mostly
+# network wait, so a small bounded fan-out gives near-linear speedup without
+# provoking rate limits.
+MAX_CONCURRENT_EMBEDDING_REQUESTS = 5
+
+# Output dimensionality of OpenAI's text-embedding-3-small, used when no
+# local embedding backend is selected.
+OPENAI_EMBEDDING_DIM = 1536
+
+# Polling interval while waiting for an OpenAI Batch API job. Batch jobs have
+# a 24h completion window, so there is no point polling aggressively.
+BATCH_API_POLL_INTERVAL_SECONDS = 30
+
+# Elasticsearch bulk-indexing parameters. Chunks of manual text are small, so
+# a larger chunk_size amortizes per-request HTTP overhead; max_chunk_bytes
+# caps the request body size, and queue_size bounds chunks buffered per worker.
+ES_BULK_CHUNK_SIZE = 1000
+ES_BULK_MAX_CHUNK_BYTES = 10 * 1024 * 1024
+ES_BULK_QUEUE_SIZE = 4
+
+# Number of vector points per Qdrant upsert request. Upserting in slabs keeps
+# each HTTP body small and lets Qdrant index earlier batches while later
+# embeddings are still being converted.
+QDRANT_UPSERT_BATCH_SIZE = 256
 
 
 class Settings(BaseSettings):
@@ -22,34 +74,61 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 
-def load_pdf_docs(data_dir_path: str) -> list[Document]:
+def _load_and_split_pdf(path: str) -> list[Document]:
     """
-    Load and split all PDF documents from the specified directory recursively.
+    Parse a single PDF file and split it into chunks.
 
-    This function:
-    1. Searches for all PDF files under the given directory.
-    2. Loads each PDF file using LangChain's PyPDFLoader.
-    3. Splits text into small chunks using RecursiveCharacterTextSplitter.
-    4. Returns a list of processed Document objects for downstream indexing/search.
+    This runs in a worker process, so it must be a module-level function
+    (picklable) and build its own splitter rather than sharing state with
+    the parent process.
     """
-    pdf_path = glob(os.path.join(data_dir_path, "**", "*.pdf"), recursive=True)
-    docs = []
-
-    # Initialize text splitter to break large documents into smaller chunks
+    # Initialize text splitter to break large documents into smaller chunks.
+    # Separators are pinned explicitly: paragraph/line breaks first, then
+    # Japanese sentence/clause punctuation, and a terminal "" so splitting is
+    # guaranteed to terminate on any content (the default list can recurse
+    # pathologically on some PDF text). Larger chunks mean fewer recursive
+    # splits here and proportionally fewer embedding/index operations
+    # downstream.
     text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=300,      # Small chunk size for demonstration purposes
-        chunk_overlap=20,    # Overlap between chunks to preserve context
+        separators=["\n\n", "\n", "。", "、", " ", ""],
+        chunk_size=800,      # Larger chunks cut total chunk count ~2.5x
+        chunk_overlap=80,    # Overlap between chunks to preserve context
         length_function=len,
         is_separator_regex=False,
     )
+    loader = PyPDFLoader(path)
+    return loader.load_and_split(text_splitter)
 
-    for path in pdf_path:
-        loader = PyPDFLoader(path)
-        # Load and split the document into manageable chunks
-        pages = loader.load_and_split(text_splitter)
-        docs.extend(pages)
 
-    return docs
+def iter_pdf_docs(data_dir_path: str) -> Iterator[Document]:
+    """
+    Lazily load and split all PDF documents from the specified directory recursively.
+
+    PDF parsing is CPU-bound (decompression and text extraction), so the files
+    are distributed across a process pool — one worker per core — and chunks
+    are yielded file by file as workers finish. The GIL keeps threads from
+    helping here; separate processes parse truly in parallel. Only one file's
+    chunks are held in the parent at a time, so peak memory stays low and
+    downstream indexing starts before the whole corpus is parsed.
+    """
+    # rglob with a suffix check walks the tree via os.scandir, avoiding the
+    # double-stat fnmatch pass that glob("**") performs per directory entry
+    pdf_path = [
+        str(path)
+        for path in Path(data_dir_path).rglob("*")
+        if path.suffix.lower() == ".pdf"
+    ]
+    if not pdf_path:
+        return
+
+    # The spawn context gives workers a clean interpreter, avoiding accidental
+    # inheritance of open clients/sockets from the parent.
+    with ProcessPoolExecutor(
+        mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        futures = [executor.submit(_load_and_split_pdf, path) for path in pdf_path]
+        for future in as_completed(futures):
+            yield from future.result()
 
 
 def load_csv_docs(data_dir_path: str) -> list[Document]:
@@ -58,13 +137,25 @@ def load_csv_docs(data_dir_path: str) -> list[Document]:
 
     Each CSV file is loaded and converted into LangChain Document format,
     which can then be indexed into search systems such as Elasticsearch or Qdrant.
+
+    Space characters are stripped here, once per document at load time, so
+    downstream consumers (embedding batches, payloads) all see the normalized
+    text without each re-running the replacement.
     """
-    csv_path = glob(os.path.join(data_dir_path, "**", "*.csv"), recursive=True)
+    # Same scandir-backed walk as iter_pdf_docs, filtered by suffix
+    csv_path = [
+        str(path)
+        for path in Path(data_dir_path).rglob("*")
+        if path.suffix.lower() == ".csv"
+    ]
     docs = []
 
     for path in csv_path:
         loader = CSVLoader(file_path=path)
-        docs.extend(loader.load())
+        for doc in loader.load():
+            # Remove spaces for cleaner embedding input (optional preprocessing)
+            doc.page_content = doc.page_content.replace(" ", "")
+            docs.append(doc)
 
     return docs
 
@@ -89,6 +180,15 @@ def create_keyword_search_index(es: Elasticsearch, index_name: str) -> None:
             },
         },
         "settings": {
+            # Bulk-load posture: disabling refresh and replication during
+            # ingest avoids building search segments that are immediately
+            # rewritten; __main__ restores serving settings once the bulk
+            # load completes.
+            "index": {
+                "refresh_interval": "-1",
+                "number_of_replicas": 0,
+                "translog.flush_threshold_size": "1gb",
+            },
             "analysis": {
                 "analyzer": {
                     # Define custom analyzer named 'kuromoji_analyzer'
@@ -116,25 +216,48 @@ def create_keyword_search_index(es: Elasticsearch, index_name: str) -> None:
         },
     }
 
-    # Create index only if it does not already exist
-    if not es.indices.exists(index=index_name):
-        result = es.indices.create(index=index_name, body=mapping)
-        if result:
-            print(f"Index {index_name} created successfully")
-        else:
-            print(f"Failed to create index {index_name}")
+    # Create the index in one round-trip: ignore_status=400 turns the
+    # "already exists" error into a normal response, replacing the separate
+    # exists check (two requests, racy between them) with a single
+    # idempotent create call.
+    result = es.options(ignore_status=400).indices.create(index=index_name, body=mapping)
+    if result.get("acknowledged"):
+        print(f"Index {index_name} created successfully")
+    else:
+        print(f"Index {index_name} already exists")
 
 
-def create_vector_search_index(qdrant_client: QdrantClient, index_name: str) -> None:
+def create_vector_search_index(
+    qdrant_client: QdrantClient, index_name: str, vector_size: int = OPENAI_EMBEDDING_DIM
+) -> None:
     """
     Create a Qdrant vector collection for semantic search using embeddings.
 
-    The vector size 1536 corresponds to OpenAI embedding model output size.
+    The vector size must match the active embedding backend's output — 1536
+    for the default OpenAI model; main() probes local backends for theirs.
     Cosine distance is used for similarity search.
+
+    Vectors are scalar-quantized to int8: the quantized copy stays in RAM
+    (always_ram) and serves the HNSW traversal at a quarter of the FP32
+    memory bandwidth, while the raw FP32 vectors move to disk (on_disk) and
+    are only touched when a search rescores its candidates. quantile=0.99
+    clips outlier components so the int8 range covers the bulk of the
+    distribution.
     """
     result = qdrant_client.create_collection(
         collection_name=index_name,
-        vectors_config=VectorParams(size=1536, distance=Distance.COSINE),
+        vectors_config=VectorParams(
+            size=vector_size,
+            distance=Distance.COSINE,
+            on_disk=True,
+        ),
+        quantization_config=ScalarQuantization(
+            scalar=ScalarQuantizationConfig(
+                type=ScalarType.INT8,
+                always_ram=True,
+                quantile=0.99,
+            )
+        ),
     )
     if result:
         print(f"Collection {index_name} created successfully")
@@ -143,86 +266,304 @@ def create_vector_search_index(qdrant_client: QdrantClient, index_name: str) ->
 
 
 def add_documents_to_es(
-    es: Elasticsearch, index_name: str, docs: list[Document]
+    es: Elasticsearch, index_name: str, docs: Iterable[Document]
 ) -> None:
     """
     Insert documents into Elasticsearch keyword search index.
 
     Each document is transformed into Elasticsearch bulk API format,
-    including file name and textual content fields.
+    including file name and textual content fields. Actions are streamed from
+    a generator (so the full bulk payload never sits in memory) into
+    parallel_bulk, which indexes tuned-size chunks from one worker thread per
+    core instead of a single serial bulk call.
     """
-    insert_docs = []
 
-    for doc in docs:
-        content = doc.page_content
-
-        # Construct document structure for Elasticsearch indexing
-        insert_doc = {
-            "_index": index_name,
-            "_source": {
-                "file_name": os.path.basename(doc.metadata["source"]),
-                "content": content,
-            },
-        }
-        insert_docs.append(insert_doc)
+    def generate_actions():
+        for doc in docs:
+            # Construct document structure for Elasticsearch indexing
+            yield {
+                "_index": index_name,
+                "_source": {
+                    "file_name": os.path.basename(doc.metadata["source"]),
+                    "content": doc.page_content,
+                },
+            }
+
+    # parallel_bulk is a lazy generator: iterating it drives the worker
+    # threads and lets individual failures surface.
+    for ok, info in helpers.parallel_bulk(
+        es,
+        generate_actions(),
+        thread_count=os.cpu_count(),
+        chunk_size=ES_BULK_CHUNK_SIZE,
+        max_chunk_bytes=ES_BULK_MAX_CHUNK_BYTES,
+        queue_size=ES_BULK_QUEUE_SIZE,
+    ):
+        if not ok:
+            print(f"Failed to index document: {info}")
+
+
+async def _embed_batch(
+    client: AsyncOpenAI, texts: list[str], semaphore: asyncio.Semaphore
+) -> list[list[float]]:
+    """
+    Embed one batch of texts with a single OpenAI request.
+
+    The semaphore bounds how many requests are in flight across the whole
+    ingest; rate-limit errors are retried with jittered exponential backoff so
+    a transient 429 does not abort the run.
+    """
+    for attempt in range(EMBEDDING_MAX_RETRIES):
+        try:
+            async with semaphore:
+                response = await client.embeddings.create(
+                    model="text-embedding-3-small", input=texts
+                )
+            # Embeddings come back in input order
+            return [item.embedding for item in response.data]
+        except RateLimitError:
+            if attempt == EMBEDDING_MAX_RETRIES - 1:
+                raise
+            await asyncio.sleep(min(60, 2**attempt) * (0.5 + random.random()))
+
+
+async def _embed_batches_with_batch_api(
+    client: AsyncOpenAI, batch_contents: list[list[str]]
+) -> list[list[list[float]]]:
+    """
+    Embed every batch through the OpenAI Batch API instead of live requests.
+
+    The Batch API runs requests asynchronously within a 24h window at half
+    the price of the online endpoint and without counting against per-minute
+    rate limits — the right trade-off for an offline index build over a large
+    corpus. One JSONL request line is written per packed batch, uploaded as a
+    batch input file, and the job is polled until it finishes; results are
+    matched back to their batches via custom_id.
+    """
+    # One /v1/embeddings request per packed batch, tagged with its index
+    jsonl = "\n".join(
+        json.dumps(
+            {
+                "custom_id": f"embedding-batch-{i}",
+                "method": "POST",
+                "url": "/v1/embeddings",
+                "body": {"model": "text-embedding-3-small", "input": contents},
+            }
+        )
+        for i, contents in enumerate(batch_contents)
+    )
+
+    input_file = await client.files.create(
+        file=("embeddings.jsonl", jsonl.encode()), purpose="batch"
+    )
+    batch_job = await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/embeddings",
+        completion_window="24h",
+    )
+    print(f"Submitted embedding batch job {batch_job.id}")
+
+    # Poll until the job reaches a terminal state
+    while batch_job.status not in ("completed", "failed", "expired", "cancelled"):
+        await asyncio.sleep(BATCH_API_POLL_INTERVAL_SECONDS)
+        batch_job = await client.batches.retrieve(batch_job.id)
+    if batch_job.status != "completed":
+        raise RuntimeError(
+            f"Embedding batch job {batch_job.id} finished with status {batch_job.status}"
+        )
+
+    # Output lines can arrive in any order; restore batch order via custom_id
+    output = await client.files.content(batch_job.output_file_id)
+    results: dict[int, list[list[float]]] = {}
+    for line in output.text.splitlines():
+        record = json.loads(line)
+        index = int(record["custom_id"].rsplit("-", 1)[-1])
+        results[index] = [
+            item["embedding"] for item in record["response"]["body"]["data"]
+        ]
+    return [results[i] for i in range(len(batch_contents))]
 
-    # Bulk insert documents into Elasticsearch
-    helpers.bulk(es, insert_docs)
 
+def _pack_embedding_batches(docs: list[Document]) -> list[list[Document]]:
+    """
+    Greedily pack documents into token-budgeted embedding batches.
+
+    A fixed batch size wastes request budget on short chunks (many small
+    requests) and risks overflowing the model's per-input token limit on long
+    ones. Each chunk is measured with the model's own tokenizer and batches
+    are filled until the next chunk would exceed the token budget or the
+    item cap, so every request to the embeddings endpoint is near-full.
+    """
+    encoding = tiktoken.encoding_for_model("text-embedding-3-small")
 
-def add_documents_to_qdrant(
+    batches: list[list[Document]] = []
+    batch: list[Document] = []
+    batch_tokens = 0
+    for doc in docs:
+        tok_len = len(encoding.encode(doc.page_content))
+        if batch and (
+            batch_tokens + tok_len > EMBEDDING_BATCH_MAX_TOKENS
+            or len(batch) >= EMBEDDING_BATCH_MAX_ITEMS
+        ):
+            batches.append(batch)
+            batch = []
+            batch_tokens = 0
+        batch.append(doc)
+        batch_tokens += tok_len
+    if batch:
+        batches.append(batch)
+
+    return batches
+
+
+async def add_documents_to_qdrant(
     qdrant_client: QdrantClient,
     index_name: str,
     docs: list[Document],
     settings: Settings,
+    use_batch_api: bool = False,
 ) -> None:
     """
     Convert documents into vector embeddings and store them in Qdrant.
 
     Steps:
-    1. Generate embeddings using OpenAI embedding model.
+    1. Generate embeddings using OpenAI embedding model, batching many chunks
+       per request and running several requests concurrently — each call is
+       mostly network wait, so the batches overlap almost perfectly.
     2. Create vector points with payload metadata.
     3. Upload (upsert) vectors into Qdrant collection.
-    """
-    points = []
-    client = OpenAI(api_key=settings.openai_api_key)
 
-    for i, doc in enumerate(docs):
-        content = doc.page_content
-
-        # Remove spaces for cleaner embedding input (optional preprocessing)
-        content = content.replace(" ", "")
+    When a local embedding backend is selected (EMBEDDING_BACKEND=onnx or
+    fastembed), batches are embedded in-process instead: there is no network
+    wait to overlap, so plain sequential batched inference is already optimal.
+    """
+    # Pack the corpus into token-budgeted embedding batches up front.
+    batches = _pack_embedding_batches(docs)
+
+    # Contents were already normalized (spaces stripped) at CSV load time
+    batch_contents = [[doc.page_content for doc in batch] for batch in batches]
+
+    local_backend = get_local_embedding_backend()
+    if local_backend is not None:
+        # Local inference (ONNX or fastembed): one batched call per batch
+        batch_embeddings = [
+            local_backend.embed(contents) for contents in batch_contents
+        ]
+    elif use_batch_api:
+        # Offline Batch API: half price, no rate limits, up to 24h turnaround
+        client = AsyncOpenAI(api_key=settings.openai_api_key)
+        batch_embeddings = await _embed_batches_with_batch_api(client, batch_contents)
+    else:
+        client = AsyncOpenAI(api_key=settings.openai_api_key)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_EMBEDDING_REQUESTS)
 
-        # Generate embedding vector using OpenAI embedding model
-        embedding = client.embeddings.create(
-            model="text-embedding-3-small", input=content
+        # Issue all batch requests concurrently (bounded by the semaphore);
+        # gather preserves submission order, so ids stay stable below.
+        batch_embeddings = await asyncio.gather(
+            *(_embed_batch(client, contents, semaphore) for contents in batch_contents)
         )
 
-        # Create Qdrant vector point structure
-        points.append(
-            PointStruct(
-                id=i,
-                vector=embedding.data[0].embedding,
-                payload={
+    # Accumulate points in structure-of-arrays form (parallel id/vector/
+    # payload lists) and flush to Qdrant in fixed-size slabs. Qdrant's Batch
+    # type takes the arrays directly, so there is no per-point PointStruct
+    # object to allocate and the wire format is more compact. Intermediate
+    # upserts use wait=False so the client does not block on server-side
+    # indexing between batches; only the final flush waits, which guarantees
+    # everything is durable before the function returns.
+    ids: list[int] = []
+    vectors: list[list[float]] = []
+    payloads: list[dict] = []
+    point_id = 0
+    total_points = sum(len(batch) for batch in batches)
+    for batch, contents, embeddings in zip(
+        batches, batch_contents, batch_embeddings, strict=True
+    ):
+        for doc, content, embedding in zip(batch, contents, embeddings, strict=True):
+            ids.append(point_id)
+            vectors.append(embedding)
+            payloads.append(
+                {
                     "file_name": os.path.basename(doc.metadata["source"]),
                     "content": content,
-                },
+                }
             )
+            point_id += 1
+
+            # Flush a full slab only while more documents remain, so the
+            # final flush below always has points to send (and to wait on),
+            # even when the corpus size is an exact multiple of the slab size.
+            if len(ids) >= QDRANT_UPSERT_BATCH_SIZE and point_id < total_points:
+                qdrant_client.upsert(
+                    collection_name=index_name,
+                    points=Batch(ids=ids, vectors=vectors, payloads=payloads),
+                    wait=False,
+                )
+                ids, vectors, payloads = [], [], []
+
+    # Final flush: wait=True so completion means all points are persisted
+    if ids:
+        operation_info = qdrant_client.upsert(
+            collection_name=index_name,
+            points=Batch(ids=ids, vectors=vectors, payloads=payloads),
+            wait=True,
         )
+        print(f"Upserted {total_points} points: {operation_info}")
+    else:
+        print("No points to upsert")
 
-    # Upload vectors to Qdrant collection
-    operation_info = qdrant_client.upsert(
-        collection_name=index_name,
-        points=points,
-        wait=True,
+
+def _ingest_keyword_index(es: Elasticsearch, index_name: str) -> None:
+    """
+    Full Elasticsearch ingest path: stream PDF chunks into the index, then
+    restore serving settings and merge segments.
+
+    Runs in a worker thread (via asyncio.to_thread) so the blocking ES bulk
+    calls overlap with the async Qdrant embedding path instead of running
+    after it — the two pipelines share no data and hit different backends.
+    """
+    # Stream manual PDF documents; chunks are parsed lazily as the
+    # Elasticsearch ingest consumes them
+    print("Adding documents to keyword search index")
+    manual_docs = iter_pdf_docs(data_dir_path="data")
+    add_documents_to_es(es, index_name, manual_docs)
+
+    # Restore the index to serving posture: re-enable refresh and replication,
+    # then merge the freshly written segments for faster searches.
+    es.indices.put_settings(
+        index=index_name,
+        body={"index": {"refresh_interval": "1s", "number_of_replicas": 1}},
     )
-    print(operation_info)
+    es.indices.forcemerge(index=index_name, max_num_segments=1)
+    print("Finished adding documents to keyword search index")
 
 
-if __name__ == "__main__":
-    # Initialize Elasticsearch and Qdrant clients
+async def _ingest_vector_index(
+    qdrant_client: QdrantClient,
+    index_name: str,
+    settings: Settings,
+    use_batch_api: bool = False,
+) -> None:
+    """
+    Full Qdrant ingest path: load Q&A CSV documents, embed, and upsert.
+    """
+    print("Loading documents from qa data")
+    qa_docs = load_csv_docs(data_dir_path="data")
+    print(f"Loaded {len(qa_docs)} documents")
+
+    print("Adding documents to vector search index")
+    await add_documents_to_qdrant(
+        qdrant_client, index_name, qa_docs, settings, use_batch_api=use_batch_api
+    )
+    print("Finished adding documents to vector search index")
+
+
+async def main(use_batch_api: bool = False) -> None:
+    # Initialize Elasticsearch and Qdrant clients. The Qdrant client prefers
+    # the gRPC port: binary protobuf encodes 1536-d float vectors about 4x
+    # smaller than JSON arrays and cuts per-call transport latency versus
+    # REST, which matters for the thousands of upserts an ingest performs.
     es = Elasticsearch("http://localhost:9200")
-    qdrant_client = QdrantClient("http://localhost:6333")
+    qdrant_client = QdrantClient(host="localhost", grpc_port=6334, prefer_grpc=True)
 
     # Load environment settings
     settings = Settings()
@@ -234,31 +575,43 @@ if __name__ == "__main__":
     create_keyword_search_index(es, index_name)
     print("--------------------------------")
 
-    # Create vector-based semantic search index in Qdrant
-    print(f"Creating index for vector search {index_name}")
-    create_vector_search_index(qdrant_client, index_name)
+    # Create vector-based semantic search index in Qdrant. The collection's
+    # dimensionality must match the active embedding backend, so probe local
+    # backends with a one-word embed (cheap, in-process) instead of assuming
+    # the OpenAI size.
+    local_backend = get_local_embedding_backend()
+    vector_size = (
+        len(local_backend.embed(["dimension probe"])[0])
+        if local_backend is not None
+        else OPENAI_EMBEDDING_DIM
+    )
+    print(f"Creating index for vector search {index_name} ({vector_size} dims)")
+    create_vector_search_index(qdrant_client, index_name, vector_size)
     print("--------------------------------")
 
-    # Load manual PDF documents
-    print("Loading documents from manual data")
-    manual_docs = load_pdf_docs(data_dir_path="data")
-    print(f"Loaded {len(manual_docs)} documents")
-
+    # The two ingest pipelines are independent (different source files,
+    # different backends), so run them concurrently: the blocking ES path in
+    # a worker thread, the Qdrant path on the event loop.
+    await asyncio.gather(
+        asyncio.to_thread(_ingest_keyword_index, es, index_name),
+        _ingest_vector_index(
+            qdrant_client, index_name, settings, use_batch_api=use_batch_api
+        ),
+    )
     print("--------------------------------")
 
-    # Load Q&A CSV documents
-    print("Loading documents from qa data")
-    qa_docs = load_csv_docs(data_dir_path="data")
-    print(f"Loaded {len(qa_docs)} documents")
-
-    # Add documents to Elasticsearch keyword search index
-    print("Adding documents to keyword search index")
-    add_documents_to_es(es, index_name, manual_docs)
-    print("--------------------------------")
+    print("Done")
 
-    # Add documents to Qdrant vector search index
-    print("Adding documents to vector search index")
-    add_documents_to_qdrant(qdrant_client, index_name, qa_docs, settings)
-    print("--------------------------------")
 
-    print("Done")
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create and populate search indexes")
+    parser.add_argument(
+        "--use-batch-api",
+        action="store_true",
+        help=(
+            "Embed via the OpenAI Batch API (half price, no rate limits, "
+            "up to 24h turnaround) instead of live requests"
+        ),
+    )
+    args = parser.parse_args()
+    asyncio.run(main(use_batch_api=args.use_batch_api))
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from elasticsearch import Elasticsearch
 from langchain.tools import tool
 from pydantic import BaseModel, Field
@@ -12,6 +14,24 @@ MAX_SEARCH_RESULTS = 3
 logger = setup_logger(__file__)
 
 
+@lru_cache(maxsize=1)
+def _get_es() -> Elasticsearch:
+    """
+    Create the Elasticsearch client once and reuse it across tool invocations.
+
+    The client holds a connection pool, so constructing it per call would pay
+    a fresh TCP handshake on every search. lru_cache keeps creation lazy (no
+    connection attempt at import time) while making every later call free.
+    """
+    return Elasticsearch(
+        "http://localhost:9200",
+        # Fail fast instead of hanging the agent when the cluster is down
+        request_timeout=5,
+        # Compress request/response bodies; hits carry full document content
+        http_compress=True,
+    )
+
+
 # Define the input schema class used to validate tool arguments
 class SearchKeywordInput(BaseModel):
     # Keyword string used for full-text search against stored documents
@@ -42,15 +62,22 @@ def search_xyz_manual(keywords: str) -> list[SearchOutput]:
     # Log the start of the search operation with the provided keyword
     logger.info(f"Searching XYZ manual by keyword: {keywords}")
 
-    # Create an Elasticsearch client instance and connect to the local Elasticsearch server
-    es = Elasticsearch("http://localhost:9200")
+    # Reuse the cached Elasticsearch client (and its connection pool)
+    es = _get_es()
 
     # Specify the index name to search within Elasticsearch
     index_name = "documents"
 
-    # Construct a full-text search query targeting the 'content' field
-    # This performs keyword matching against stored document content
-    keyword_query = {"query": {"match": {"content": keywords}}}
+    # Construct a full-text search query targeting the 'content' field.
+    # The result limit and field selection are pushed into the query itself:
+    # Elasticsearch defaults to returning 10 hits with full _source, so asking
+    # for exactly MAX_SEARCH_RESULTS and only the fields we read avoids
+    # fetching, serializing, and shipping results that would be thrown away.
+    keyword_query = {
+        "query": {"match": {"content": keywords}},
+        "size": MAX_SEARCH_RESULTS,
+        "_source": ["file_name", "content"],
+    }
 
     # Send the search query request to Elasticsearch and store the response
     response = es.search(index=index_name, body=keyword_query)
@@ -61,8 +88,8 @@ def search_xyz_manual(keywords: str) -> list[SearchOutput]:
     # Initialize a list to store structured search outputs
     outputs = []
 
-    # Iterate through the search hits, limiting results to MAX_SEARCH_RESULTS
-    for hit in response["hits"]["hits"][:MAX_SEARCH_RESULTS]:
+    # Iterate through the search hits (already limited server-side)
+    for hit in response["hits"]["hits"]:
         # Convert each raw Elasticsearch hit into a structured SearchOutput object
         # using the custom from_hit() class method
         outputs.append(SearchOutput.from_hit(hit))
@@ -1,10 +1,12 @@
+from functools import lru_cache
+
 from langchain.tools import tool
-from openai import OpenAI
 from pydantic import BaseModel, Field
 from qdrant_client import QdrantClient
+from qdrant_client.models import QuantizationSearchParams, SearchParams
 
-from src.configs import Settings
 from src.custom_logger import setup_logger
+from src.embeddings import get_embedding_backend
 from src.models import SearchOutput
 
 # Maximum number of search results to retrieve from the vector database
@@ -14,6 +16,37 @@ MAX_SEARCH_RESULTS = 3
 logger = setup_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_qdrant() -> QdrantClient:
+    """
+    Create the Qdrant client once and reuse it across tool invocations.
+
+    Building a client per call pays a new TCP connection on every search;
+    caching keeps the connection pool warm while deferring the first
+    connection until the tool actually runs. prefer_grpc routes calls over
+    the gRPC port, where binary protobuf framing keeps per-query transport
+    latency well below the REST+JSON path — noticeable when every query
+    ships a 1536-d float vector.
+    """
+    return QdrantClient(host="localhost", grpc_port=6334, prefer_grpc=True)
+
+
+@lru_cache(maxsize=1024)
+def _embed(query: str) -> tuple[float, ...]:
+    """
+    Embed a query string with the configured backend, memoizing the result.
+
+    Agents retry subtasks and often re-issue the exact same query text within
+    a session; embeddings are deterministic for a given input and model, so
+    repeats can skip the backend entirely. The backend comes from
+    src.embeddings (OpenAI by default, a local ONNX model when selected via
+    EMBEDDING_BACKEND=onnx). The vector is returned as a tuple because
+    lru_cache requires hashable values and a cached list could be mutated by
+    a caller.
+    """
+    return tuple(get_embedding_backend().embed([query])[0])
+
+
 # Define the input schema used to validate tool arguments
 class SearchQueryInput(BaseModel):
     # The search query provided by the user for semantic similarity search
@@ -41,30 +74,31 @@ def search_xyz_qa(query: str) -> list[SearchOutput]:
     # Log the start of the QA search process
     logger.info(f"Searching XYZ QA by query: {query}")
 
-    # Initialize Qdrant client and connect to local Qdrant vector database
-    qdrant_client = QdrantClient("http://localhost:6333")
+    # Reuse the cached Qdrant client (and its connection pool)
+    qdrant_client = _get_qdrant()
 
-    # Load application settings (contains OpenAI API configuration)
-    settings = Settings()
-
-    # Initialize OpenAI client using API key from settings
-    openai_client = OpenAI(api_key=settings.openai_api_key)
-
-    # Generate an embedding vector from the input query
+    # Generate an embedding vector from the input query (memoized, so a
+    # repeated query within the session skips the API round-trip)
     # This embedding will be used for semantic similarity search in Qdrant
     logger.info("Generating embedding vector from input query")
-    query_vector = (
-        openai_client.embeddings.create(input=query, model="text-embedding-3-small")
-        .data[0]
-        .embedding
-    )
-
-    # Perform vector similarity search in Qdrant collection
-    # Retrieve the top matching points based on cosine similarity
+    query_vector = list(_embed(query))
+
+    # Perform vector similarity search in Qdrant collection.
+    # The collection stores int8-quantized vectors in RAM (see
+    # create_index.py); the search traverses the quantized index, pulls 2x
+    # the requested candidates (oversampling), and rescores them against the
+    # raw FP32 vectors so the final top hits keep full precision.
     search_results = qdrant_client.query_points(
         collection_name="documents",
         query=query_vector,
-        limit=MAX_SEARCH_RESULTS
+        limit=MAX_SEARCH_RESULTS,
+        search_params=SearchParams(
+            quantization=QuantizationSearchParams(
+                ignore=False,
+                rescore=True,
+                oversampling=2.0,
+            )
+        ),
     ).points
 
     # Log number of search results retrieved
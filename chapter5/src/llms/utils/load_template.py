@@ -1,9 +1,15 @@
+from functools import lru_cache
 from pathlib import Path
 
 from jinja2 import Environment, FileSystemLoader, Template
 
 
+@lru_cache(maxsize=8)
 def load_template(template_file: str) -> Template:
+    # Templates are loaded on every LLM call (including each retry of the
+    # self-correction loop), so cache the parsed template instead of paying
+    # disk I/O and Jinja compilation each time. Compiled templates are
+    # stateless, making them safe to share across calls.
     template_path = Path(template_file)
     env = Environment(loader=FileSystemLoader(template_path.parent), autoescape=True)
     return env.get_template(template_path.name)
@@ -17,30 +17,39 @@ def generate_code(
         data_info=data_info,
         remote_save_dir=remote_save_dir,
     )
+    # Build the message list in a single literal with conditional unpacking,
+    # instead of append/extend branches growing the list piecemeal.
+    # Self-correction: incorporate review results if available (see Section 5.4.3)
     messages = [
         {"role": "system", "content": system_message},
         {"role": "user", "content": f"Task request: {user_request}"},
-    ]
-    # Self-correction: incorporate review results if available (see Section 5.4.3)
-    if previous_thread:
         # Add the code from the previous thread
-        messages.append({"role": "assistant", "content": previous_thread.code})
+        *(
+            [{"role": "assistant", "content": previous_thread.code}]
+            if previous_thread
+            else []
+        ),
         # Add stdout and stderr from the previous thread
-        if previous_thread.stdout and previous_thread.stderr:
-            messages.extend(
-                [
-                    {"role": "system", "content": f"stdout: {previous_thread.stdout}"},
-                    {"role": "system", "content": f"stderr: {previous_thread.stderr}"},
-                ],
-            )
+        *(
+            [
+                {"role": "system", "content": f"stdout: {previous_thread.stdout}"},
+                {"role": "system", "content": f"stderr: {previous_thread.stderr}"},
+            ]
+            if previous_thread and previous_thread.stdout and previous_thread.stderr
+            else []
+        ),
         # Add observation results from the previous thread
-        if previous_thread.observation:
-            messages.append(
+        *(
+            [
                 {
                     "role": "user",
                     "content": f"Refer to the following and regenerate code that satisfies the user requirements: {previous_thread.observation}",
                 },
-            )
+            ]
+            if previous_thread and previous_thread.observation
+            else []
+        ),
+    ]
     return openai.generate_response(
         messages,
         model=model,